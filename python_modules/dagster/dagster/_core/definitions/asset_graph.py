@@ -531,6 +531,14 @@ def toposort_asset_keys(self) -> Sequence[AbstractSet[AssetKey]]:
             {key for key in level} for level in toposort.toposort(self._asset_dep_graph["upstream"])
         ]
 
+    @cached_method
+    def toposort_level_by_asset_key(self) -> Mapping[AssetKey, int]:
+        return {
+            asset_key: i
+            for i, asset_keys in enumerate(self.toposort_asset_keys())
+            for asset_key in asset_keys
+        }
+
     def get_auto_materialize_policy(self, asset_key: AssetKey) -> Optional[AutoMaterializePolicy]:
         return self.auto_materialize_policies_by_key.get(asset_key)
 
@@ -834,12 +842,7 @@ def __init__(
         self._asset_graph = asset_graph
         self._include_required_multi_assets = include_required_multi_assets
 
-        toposorted_asset_keys = asset_graph.toposort_asset_keys()
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(toposorted_asset_keys)
-            for asset_key in asset_keys
-        }
+        self._toposort_level_by_asset_key = asset_graph.toposort_level_by_asset_key()
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
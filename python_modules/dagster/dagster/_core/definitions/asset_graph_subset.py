@@ -366,11 +366,9 @@ def from_asset_keys(
             if partitions_def:
                 partitions_subsets_by_asset_key[
                     asset_key
-                ] = partitions_def.empty_subset().with_partition_keys(
-                    partitions_def.get_partition_keys(
-                        dynamic_partitions_store=dynamic_partitions_store,
-                        current_time=current_time,
-                    )
+                ] = partitions_def.subset_with_all_partitions(
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
                 )
             else:
                 non_partitioned_asset_keys.add(asset_key)
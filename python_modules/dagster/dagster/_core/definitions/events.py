@@ -99,7 +99,15 @@ def __repr__(self):
         return f"AssetKey({self.path})"
 
     def __hash__(self):
-        return hash(tuple(self.path))
+        # asset keys are hashed constantly as dict and set members, so hash the path only once
+        cached_hash = self.__dict__.get("_hash")
+        if cached_hash is None:
+            cached_hash = self.__dict__["_hash"] = hash(tuple(self.path))
+        return cached_hash
+
+    def __getstate__(self):
+        # don't pickle the cached hash, which is only valid within the current process
+        return None
 
     def __eq__(self, other):
         if not isinstance(other, AssetKey):
@@ -965,6 +965,39 @@ def partitions_subset_class(self) -> Type["PartitionsSubset"]:
     def empty_subset(self) -> "PartitionsSubset":
         return self.partitions_subset_class.empty_subset(self)
 
+    def subset_with_all_partitions(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "PartitionsSubset":
+        if self.end_offset != 0:
+            return super().subset_with_all_partitions(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+
+        # Resolve the current time once so that the window and the partition count agree
+        current_time = cast(
+            datetime,
+            (
+                pendulum.instance(current_time, tz=self.timezone)
+                if current_time
+                else pendulum.now(self.timezone)
+            ),
+        )
+
+        # Represent the full range as a single time window, instead of formatting a partition key
+        # for every partition
+        first_window = self.get_first_partition_window(current_time=current_time)
+        last_window = self.get_last_partition_window(current_time=current_time)
+        if first_window is None or last_window is None:
+            return self.empty_subset()
+
+        return TimeWindowPartitionsSubset(
+            self,
+            num_partitions=self.get_num_partitions(current_time=current_time),
+            included_time_windows=[TimeWindow(first_window.start, last_window.end)],
+        )
+
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
     ) -> str:
@@ -319,6 +319,52 @@ def get_targeted_asset_keys_topological_order(
 
         return targeted_toposorted_keys
 
+    def _get_backfill_status_for_asset_key(
+        self, asset_key: AssetKey, asset_graph: AssetGraph
+    ) -> Union[PartitionedAssetBackfillStatus, UnpartitionedAssetBackfillStatus]:
+        if asset_graph.get_partitions_def(asset_key) is not None:
+            materialized_subset = self.materialized_subset.get_partitions_subset(
+                asset_key, asset_graph
+            )
+            failed_subset = self.failed_and_downstream_subset.get_partitions_subset(
+                asset_key, asset_graph
+            )
+            requested_subset = self.requested_subset.get_partitions_subset(asset_key, asset_graph)
+
+            # Only the counts are needed, so compare plain sets of partition keys rather than
+            # building intermediate PartitionsSubsets.
+            materialized_keys = set(materialized_subset.get_partition_keys())
+            failed_keys = set(failed_subset.get_partition_keys()) - materialized_keys
+
+            # The failed subset includes partitions that failed and their downstream partitions.
+            # The downstream partitions are not included in the requested subset, so we determine
+            # the in progress subset by subtracting partitions that are failed and requested.
+            in_progress_keys = (
+                set(requested_subset.get_partition_keys()) - failed_keys - materialized_keys
+            )
+
+            return PartitionedAssetBackfillStatus(
+                asset_key,
+                len(self.target_subset.get_partitions_subset(asset_key, asset_graph)),
+                {
+                    AssetBackfillStatus.MATERIALIZED: len(materialized_keys),
+                    AssetBackfillStatus.FAILED: len(failed_keys),
+                    AssetBackfillStatus.IN_PROGRESS: len(in_progress_keys),
+                },
+            )
+        else:
+            failed = bool(asset_key in self.failed_and_downstream_subset.non_partitioned_asset_keys)
+            materialized = bool(asset_key in self.materialized_subset.non_partitioned_asset_keys)
+            in_progress = bool(asset_key in self.requested_subset.non_partitioned_asset_keys)
+
+            if failed:
+                return UnpartitionedAssetBackfillStatus(asset_key, AssetBackfillStatus.FAILED)
+            if materialized:
+                return UnpartitionedAssetBackfillStatus(asset_key, AssetBackfillStatus.MATERIALIZED)
+            if in_progress:
+                return UnpartitionedAssetBackfillStatus(asset_key, AssetBackfillStatus.IN_PROGRESS)
+            return UnpartitionedAssetBackfillStatus(asset_key, None)
+
     def get_backfill_status_per_asset_key(
         self, asset_graph: AssetGraph
     ) -> Sequence[Union[PartitionedAssetBackfillStatus, UnpartitionedAssetBackfillStatus]]:
@@ -326,62 +372,23 @@ def get_backfill_status_per_asset_key(
         This list orders assets topologically and only contains statuses for assets that are
         currently existent in the asset graph.
         """
-
-        def _get_status_for_asset_key(
-            asset_key: AssetKey,
-        ) -> Union[PartitionedAssetBackfillStatus, UnpartitionedAssetBackfillStatus]:
-            if asset_graph.get_partitions_def(asset_key) is not None:
-                materialized_subset = self.materialized_subset.get_partitions_subset(
-                    asset_key, asset_graph
-                )
-                failed_subset = self.failed_and_downstream_subset.get_partitions_subset(
-                    asset_key, asset_graph
-                )
-                requested_subset = self.requested_subset.get_partitions_subset(
-                    asset_key, asset_graph
-                )
-
-                # The failed subset includes partitions that failed and their downstream partitions.
-                # The downstream partitions are not included in the requested subset, so we determine
-                # the in progress subset by subtracting partitions that are failed and requested.
-                requested_and_failed_subset = failed_subset & requested_subset
-                in_progress_subset = requested_subset - (
-                    requested_and_failed_subset | materialized_subset
-                )
-
-                return PartitionedAssetBackfillStatus(
-                    asset_key,
-                    len(self.target_subset.get_partitions_subset(asset_key, asset_graph)),
-                    {
-                        AssetBackfillStatus.MATERIALIZED: len(materialized_subset),
-                        AssetBackfillStatus.FAILED: len(failed_subset - materialized_subset),
-                        AssetBackfillStatus.IN_PROGRESS: len(in_progress_subset),
-                    },
-                )
-            else:
-                failed = bool(
-                    asset_key in self.failed_and_downstream_subset.non_partitioned_asset_keys
-                )
-                materialized = bool(
-                    asset_key in self.materialized_subset.non_partitioned_asset_keys
-                )
-                in_progress = bool(asset_key in self.requested_subset.non_partitioned_asset_keys)
-
-                if failed:
-                    return UnpartitionedAssetBackfillStatus(asset_key, AssetBackfillStatus.FAILED)
-                if materialized:
-                    return UnpartitionedAssetBackfillStatus(
-                        asset_key, AssetBackfillStatus.MATERIALIZED
-                    )
-                if in_progress:
-                    return UnpartitionedAssetBackfillStatus(
-                        asset_key, AssetBackfillStatus.IN_PROGRESS
-                    )
-                return UnpartitionedAssetBackfillStatus(asset_key, None)
-
         # Only return back statuses for the assets that still exist in the workspace
         topological_order = self.get_targeted_asset_keys_topological_order(asset_graph)
-        return [_get_status_for_asset_key(asset_key) for asset_key in topological_order]
+        return [
+            self._get_backfill_status_for_asset_key(asset_key, asset_graph)
+            for asset_key in topological_order
+        ]
+
+    def get_backfill_status_by_asset_key(
+        self, asset_graph: AssetGraph
+    ) -> Mapping[AssetKey, Union[PartitionedAssetBackfillStatus, UnpartitionedAssetBackfillStatus]]:
+        """Returns a mapping from each targeted asset key to its backfill status. Only contains
+        statuses for assets that are currently existent in the asset graph.
+        """
+        return {
+            asset_key: self._get_backfill_status_for_asset_key(asset_key, asset_graph)
+            for asset_key in self.get_targeted_asset_keys_topological_order(asset_graph)
+        }
 
     def get_partition_names(self) -> Optional[Sequence[str]]:
         """Only valid when the same number of partitions are targeted in every asset.
@@ -498,6 +505,20 @@ def from_partitions_by_assets(
         )
         return cls.empty(target_subset, backfill_start_time, dynamic_partitions_store)
 
+    @classmethod
+    def from_all_partitions(
+        cls,
+        asset_graph: AssetGraph,
+        asset_selection: Sequence[AssetKey],
+        dynamic_partitions_store: DynamicPartitionsStore,
+        backfill_start_time: datetime,
+    ) -> "AssetBackfillData":
+        """Create an AssetBackfillData object that targets every partition of the selected assets."""
+        target_subset = AssetGraphSubset.from_asset_keys(
+            asset_selection, asset_graph, dynamic_partitions_store, backfill_start_time
+        )
+        return cls.empty(target_subset, backfill_start_time, dynamic_partitions_store)
+
     @classmethod
     def from_asset_partitions(
         cls,
@@ -514,8 +535,11 @@ def from_asset_partitions(
         )
 
         if all_partitions:
-            target_subset = AssetGraphSubset.from_asset_keys(
-                asset_selection, asset_graph, dynamic_partitions_store, backfill_start_time
+            return cls.from_all_partitions(
+                asset_graph=asset_graph,
+                asset_selection=asset_selection,
+                dynamic_partitions_store=dynamic_partitions_store,
+                backfill_start_time=backfill_start_time,
             )
         elif partition_names is not None:
             partitioned_asset_keys = {
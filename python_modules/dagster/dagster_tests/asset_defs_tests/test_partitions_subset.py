@@ -196,3 +196,28 @@ def test_all_partitions_subset_time_window_partitions_def() -> None:
         round_trip_subset = deserialize_value(serialize_value(all_subset.to_serializable_subset()))  # type: ignore
         assert isinstance(round_trip_subset, TimeWindowPartitionsSubset)
         assert set(round_trip_subset.get_partition_keys()) == set(all_subset.get_partition_keys())
+
+
+def test_subset_with_all_partitions_time_window_partitions_def() -> None:
+    current_time = create_pendulum_time(2020, 1, 6, hour=10)
+    time_window_partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
+    all_subset = time_window_partitions_def.subset_with_all_partitions(current_time=current_time)
+    assert isinstance(all_subset, TimeWindowPartitionsSubset)
+    assert len(all_subset.included_time_windows) == 1
+    assert len(all_subset) == 5
+    assert all_subset == time_window_partitions_def.empty_subset().with_partition_keys(
+        time_window_partitions_def.get_partition_keys(current_time=current_time)
+    )
+
+    with_end_offset = DailyPartitionsDefinition(start_date="2020-01-01", end_offset=1)
+    assert set(
+        with_end_offset.subset_with_all_partitions(current_time).get_partition_keys()
+    ) == set(with_end_offset.get_partition_keys(current_time=current_time))
+
+    not_started = DailyPartitionsDefinition(start_date="2020-02-01")
+    assert len(not_started.subset_with_all_partitions(current_time=current_time)) == 0
+
+    with pendulum.test(current_time):
+        subset_at_now = time_window_partitions_def.subset_with_all_partitions()
+    assert subset_at_now == all_subset
+    assert len(subset_at_now) == 5
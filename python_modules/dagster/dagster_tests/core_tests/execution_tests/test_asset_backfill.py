@@ -540,7 +540,8 @@ def execute_asset_backfill_iteration_consume_generator(
 ) -> AssetBackfillIterationResult:
     traced_counter.set(Counter())
     with environ({"ASSET_BACKFILL_CURSOR_DELAY_TIME": "0"}):
-        for result in execute_asset_backfill_iteration_inner(
+        # the iteration yields None to heartbeat and then the result as its final value
+        *_, result = execute_asset_backfill_iteration_inner(
             backfill_id=backfill_id,
             asset_backfill_data=asset_backfill_data,
             instance_queryer=CachingInstanceQueryer(
@@ -549,13 +550,12 @@ def execute_asset_backfill_iteration_consume_generator(
             asset_graph=asset_graph,
             run_tags={},
             backfill_start_time=asset_backfill_data.backfill_start_time,
-        ):
-            if isinstance(result, AssetBackfillIterationResult):
-                counts = traced_counter.get().counts()
-                assert counts.get("DagsterInstance.get_dynamic_partitions", 0) <= 1
-                return result
+        )
 
-    assert False
+    assert isinstance(result, AssetBackfillIterationResult)
+    counts = traced_counter.get().counts()
+    assert counts.get("DagsterInstance.get_dynamic_partitions", 0) <= 1
+    return result
 
 
 def run_backfill_to_completion(
@@ -669,16 +669,16 @@ def _requested_asset_partitions_in_run_request(
             start=partition_range_start,
             end=partition_range_end,
         )
-        asset_partitions = []
+        asset_partitions: Set[AssetKeyPartitionKey] = set()
         for asset_key in asset_keys:
-            asset_partitions.extend(
+            asset_partitions.update(
                 asset_graph.get_asset_partitions_in_range(
                     asset_key=asset_key,
                     partition_key_range=partition_range,
                     dynamic_partitions_store=MagicMock(),
                 )
             )
-        duplicate_asset_partitions = set(asset_partitions) & requested_asset_partitions
+        duplicate_asset_partitions = asset_partitions & requested_asset_partitions
         assert len(duplicate_asset_partitions) == 0, (
             f" {duplicate_asset_partitions} requested twice. Requested:"
             f" {requested_asset_partitions}."
@@ -1,9 +1,14 @@
-import math
-from unittest.mock import MagicMock
+# The tests in this module are independent of one another: module-level state is either immutable
+# or memoized per process, and module-scoped fixtures are re-created in each pytest-xdist worker.
+# They can therefore be distributed with `pytest -n auto`.
+import functools
+from typing import Iterator, Sequence, Tuple
 
+import dagster._check as check
 import pendulum
 import pytest
 from dagster import (
+    AssetKey,
     BackfillPolicy,
     DagsterInstance,
     DailyPartitionsDefinition,
@@ -11,8 +16,16 @@
     WeeklyPartitionsDefinition,
     asset,
 )
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.errors import DagsterBackfillFailedError
-from dagster._core.execution.asset_backfill import AssetBackfillData, AssetBackfillStatus
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillData,
+    AssetBackfillStatus,
+    PartitionedAssetBackfillStatus,
+    UnpartitionedAssetBackfillStatus,
+)
+from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.storage.tags import (
     ASSET_PARTITION_RANGE_END_TAG,
     ASSET_PARTITION_RANGE_START_TAG,
@@ -24,8 +37,40 @@
     run_backfill_to_completion,
 )
 
+# A fixed evaluation time keeps partition counts from growing with wall-clock time.
+TIME_NOW = pendulum.datetime(2023, 8, 15, tz="UTC")
+
+
+class NoopDynamicPartitionsStore(DynamicPartitionsStore):
+    """Stand-in store for backfills that do not target any dynamically partitioned assets."""
+
+    def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
+        return []
+
+    def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
+        return False
+
+
+NOOP_DYNAMIC_PARTITIONS_STORE = NoopDynamicPartitionsStore()
+
+
+@pytest.fixture(name="instance", scope="module")
+def instance_fixture() -> Iterator[DagsterInstance]:
+    # Shared by tests that only evaluate a single backfill iteration and so never write to the
+    # instance. Tests that launch runs create their own instance.
+    instance = DagsterInstance.ephemeral()
+    yield instance
+    instance.dispose()
+
+
+@functools.lru_cache(maxsize=None)
+def get_cached_asset_graph(assets: Tuple[AssetsDefinition, ...]) -> ExternalAssetGraph:
+    # keyed on the tuple rather than a set so that the asset graph's iteration order is stable
+    return get_asset_graph({"repo": list(assets)})
 
-def test_asset_backfill_not_all_asset_have_backfill_policy():
+
+@pytest.fixture(name="not_all_backfill_policy_assets", scope="module")
+def not_all_backfill_policy_assets_fixture() -> Tuple[AssetsDefinition, ...]:
     @asset(backfill_policy=None)
     def unpartitioned_upstream_of_partitioned():
         return 1
@@ -37,24 +82,152 @@ def unpartitioned_upstream_of_partitioned():
     def upstream_daily_partitioned_asset():
         return 1
 
-    assets_by_repo_name = {
-        "repo": [
-            unpartitioned_upstream_of_partitioned,
-            upstream_daily_partitioned_asset,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
+    return (unpartitioned_upstream_of_partitioned, upstream_daily_partitioned_asset)
 
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
+
+@pytest.fixture(name="different_backfill_policy_assets", scope="module")
+def different_backfill_policy_assets_fixture() -> Tuple[AssetsDefinition, ...]:
+    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
+
+    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def upstream_daily_partitioned_asset():
+        return 1
+
+    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.multi_run())
+    def downstream_daily_partitioned_asset(upstream_daily_partitioned_asset):
+        return upstream_daily_partitioned_asset + 1
+
+    return (upstream_daily_partitioned_asset, downstream_daily_partitioned_asset)
+
+
+@pytest.fixture(name="single_run_assets", scope="module")
+def single_run_assets_fixture() -> Tuple[AssetsDefinition, ...]:
+    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
+
+    @asset(backfill_policy=BackfillPolicy.single_run())
+    def upstream_non_partitioned_asset():
+        return 1
+
+    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def upstream_daily_partitioned_asset():
+        return 1
+
+    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def downstream_daily_partitioned_asset(upstream_daily_partitioned_asset):
+        return upstream_daily_partitioned_asset + 1
+
+    return (
+        upstream_non_partitioned_asset,
+        upstream_daily_partitioned_asset,
+        downstream_daily_partitioned_asset,
+    )
+
+
+@pytest.fixture(name="multi_run_assets", scope="module")
+def multi_run_assets_fixture() -> Tuple[AssetsDefinition, ...]:
+    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition(
+        "2023-01-01", end_date="2023-08-11"
+    )
+
+    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.multi_run(7))
+    def upstream_daily_partitioned_asset():
+        return 1
+
+    return (upstream_daily_partitioned_asset,)
+
+
+@pytest.fixture(name="daily_to_weekly_assets", scope="module")
+def daily_to_weekly_assets_fixture() -> Tuple[AssetsDefinition, ...]:
+    @asset(backfill_policy=BackfillPolicy.single_run())
+    def unpartitioned_upstream_of_partitioned():
+        return 1
+
+    # Pin the end dates so the number of partitions backfilled does not grow with wall-clock time.
+    @asset(
+        partitions_def=DailyPartitionsDefinition("2023-01-01", end_date="2023-03-01"),
+        backfill_policy=BackfillPolicy.single_run(),
+        deps={unpartitioned_upstream_of_partitioned},
+    )
+    def upstream_daily_partitioned_asset():
+        return 2
+
+    @asset(
+        partitions_def=WeeklyPartitionsDefinition("2023-01-01", end_date="2023-03-01"),
+        backfill_policy=BackfillPolicy.single_run(),
+        deps={upstream_daily_partitioned_asset},
+    )
+    def downstream_weekly_partitioned_asset():
+        return 3
+
+    return (
+        unpartitioned_upstream_of_partitioned,
+        upstream_daily_partitioned_asset,
+        downstream_weekly_partitioned_asset,
+    )
+
+
+@pytest.fixture(name="multi_asset_run_assets", scope="module")
+def multi_asset_run_assets_fixture() -> Tuple[AssetsDefinition, ...]:
+    upstream_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
+    downstream_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-02")
+
+    @asset(partitions_def=upstream_partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def upstream_a():
+        return 1
+
+    @asset(partitions_def=upstream_partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def upstream_b():
+        return 2
+
+    @asset(
+        partitions_def=downstream_partitions_def,
+        backfill_policy=BackfillPolicy.single_run(),
+        deps={"upstream_a"},
+    )
+    def downstream_a():
+        return 1
+
+    @asset(
+        partitions_def=downstream_partitions_def,
+        backfill_policy=BackfillPolicy.single_run(),
+        deps={"upstream_b"},
+    )
+    def downstream_b():
+        return 2
+
+    return (upstream_a, upstream_b, downstream_a, downstream_b)
+
+
+@pytest.fixture(name="dynamic_partitions_assets", scope="module")
+def dynamic_partitions_assets_fixture() -> Tuple[AssetsDefinition, ...]:
+    @asset(
+        backfill_policy=BackfillPolicy.single_run(),
+        partitions_def=DynamicPartitionsDefinition(name="apple"),
+    )
+    def asset1() -> None:
+        ...
+
+    return (asset1,)
+
+
+def test_asset_backfill_not_all_asset_have_backfill_policy(
+    not_all_backfill_policy_assets: Tuple[AssetsDefinition, ...],
+    instance: DagsterInstance,
+):
+    (
+        unpartitioned_upstream_of_partitioned,
+        upstream_daily_partitioned_asset,
+    ) = not_all_backfill_policy_assets
+    asset_graph = get_cached_asset_graph(not_all_backfill_policy_assets)
+
+    backfill_data = AssetBackfillData.from_all_partitions(
         asset_graph=asset_graph,
         asset_selection=[
             unpartitioned_upstream_of_partitioned.key,
             upstream_daily_partitioned_asset.key,
         ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=pendulum.now("UTC"),
+        dynamic_partitions_store=NOOP_DYNAMIC_PARTITIONS_STORE,
+        backfill_start_time=TIME_NOW,
     )
 
     with pytest.raises(
@@ -68,115 +241,95 @@ def upstream_daily_partitioned_asset():
             backfill_id="test_backfill_id",
             asset_backfill_data=backfill_data,
             asset_graph=asset_graph,
-            instance=DagsterInstance.ephemeral(),
+            instance=instance,
         )
 
 
-def test_asset_backfill_parent_and_children_have_different_backfill_policy():
-    time_now = pendulum.now("UTC")
-    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
-
-    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
-    def upstream_daily_partitioned_asset():
-        return 1
-
-    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.multi_run())
-    def downstream_daily_partitioned_asset(upstream_daily_partitioned_asset):
-        return upstream_daily_partitioned_asset + 1
-
-    assets_by_repo_name = {
-        "repo": [
-            upstream_daily_partitioned_asset,
-            downstream_daily_partitioned_asset,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
+def test_asset_backfill_parent_and_children_have_different_backfill_policy(
+    different_backfill_policy_assets: Tuple[AssetsDefinition, ...],
+    instance: DagsterInstance,
+):
+    (
+        upstream_daily_partitioned_asset,
+        downstream_daily_partitioned_asset,
+    ) = different_backfill_policy_assets
+    asset_graph = get_cached_asset_graph(different_backfill_policy_assets)
 
     backfill_id = "test_backfill_id"
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
+    backfill_data = AssetBackfillData.from_all_partitions(
         asset_graph=asset_graph,
         asset_selection=[
             upstream_daily_partitioned_asset.key,
             downstream_daily_partitioned_asset.key,
         ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=time_now,
+        dynamic_partitions_store=NOOP_DYNAMIC_PARTITIONS_STORE,
+        backfill_start_time=TIME_NOW,
     )
 
     result1 = execute_asset_backfill_iteration_consume_generator(
         backfill_id=backfill_id,
         asset_backfill_data=backfill_data,
         asset_graph=asset_graph,
-        instance=DagsterInstance.ephemeral(),
+        instance=instance,
+    )
+    assert (
+        result1.backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
+        > backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
     )
-    assert result1.backfill_data != backfill_data
     assert len(result1.run_requests) == 1
     # The first iteration of backfill should only create run request for the upstream asset since
     # the downstream does not have same backfill policy as the upstream.
     assert result1.run_requests[0].asset_selection == [upstream_daily_partitioned_asset.key]
 
 
-def test_asset_backfill_parent_and_children_have_same_backfill_policy():
-    time_now = pendulum.now("UTC")
-    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
-
-    @asset(backfill_policy=BackfillPolicy.single_run())
-    def upstream_non_partitioned_asset():
-        return 1
-
-    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
-    def upstream_daily_partitioned_asset():
-        return 1
-
-    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
-    def downstream_daily_partitioned_asset(upstream_daily_partitioned_asset):
-        return upstream_daily_partitioned_asset + 1
-
-    assets_by_repo_name = {
-        "repo": [
-            upstream_non_partitioned_asset,
-            upstream_daily_partitioned_asset,
-            downstream_daily_partitioned_asset,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
+def test_asset_backfill_parent_and_children_have_same_backfill_policy(
+    single_run_assets: Tuple[AssetsDefinition, ...],
+    instance: DagsterInstance,
+):
+    (
+        upstream_non_partitioned_asset,
+        upstream_daily_partitioned_asset,
+        downstream_daily_partitioned_asset,
+    ) = single_run_assets
+    asset_graph = get_cached_asset_graph(single_run_assets)
 
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
+    backfill_data = AssetBackfillData.from_all_partitions(
         asset_graph=asset_graph,
         asset_selection=[
             upstream_daily_partitioned_asset.key,
             downstream_daily_partitioned_asset.key,
             upstream_non_partitioned_asset.key,
         ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=time_now,
+        dynamic_partitions_store=NOOP_DYNAMIC_PARTITIONS_STORE,
+        backfill_start_time=TIME_NOW,
     )
 
+    last_partition_key = check.not_none(
+        asset_graph.get_partitions_def(upstream_daily_partitioned_asset.key)
+    ).get_last_partition_key(TIME_NOW)
+
     result = execute_asset_backfill_iteration_consume_generator(
         backfill_id="test_backfill_id",
         asset_backfill_data=backfill_data,
         asset_graph=asset_graph,
-        instance=DagsterInstance.ephemeral(),
+        instance=instance,
+    )
+    assert (
+        result.backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
+        > backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
     )
-    assert result.backfill_data != backfill_data
     assert len(result.run_requests) == 2
 
     for run_request in result.run_requests:
-        if run_request.tags.__contains__(ASSET_PARTITION_RANGE_START_TAG):
+        if ASSET_PARTITION_RANGE_START_TAG in run_request.tags:
             # single run request for partitioned asset, both parent and the children somce they share same
             # partitions def and backfill policy
             assert run_request.partition_key is None
-            assert upstream_daily_partitioned_asset.key in run_request.asset_selection
-            assert downstream_daily_partitioned_asset.key in run_request.asset_selection
+            selection_set = set(run_request.asset_selection or [])
+            assert upstream_daily_partitioned_asset.key in selection_set
+            assert downstream_daily_partitioned_asset.key in selection_set
             assert run_request.tags.get(ASSET_PARTITION_RANGE_START_TAG) == "2023-01-01"
-            assert (
-                run_request.tags.get(ASSET_PARTITION_RANGE_END_TAG)
-                == daily_partitions_def.get_partition_keys(time_now)[-1]
-            )
+            assert run_request.tags.get(ASSET_PARTITION_RANGE_END_TAG) == last_partition_key
         else:
             assert run_request.partition_key is None
             assert run_request.asset_selection == [upstream_non_partitioned_asset.key]
@@ -184,178 +337,99 @@ def downstream_daily_partitioned_asset(upstream_daily_partitioned_asset):
             assert run_request.tags.get(ASSET_PARTITION_RANGE_END_TAG) is None
 
 
-def test_asset_backfill_return_single_run_request_for_non_partitioned():
-    @asset(backfill_policy=BackfillPolicy.single_run())
-    def unpartitioned_upstream_of_partitioned():
-        return 1
+def assert_run_requests_for_backfill_policy(
+    assets: Tuple[AssetsDefinition, ...],
+    asset_key: AssetKey,
+    expected_num_run_requests: int,
+    instance: DagsterInstance,
+) -> None:
+    asset_graph = get_cached_asset_graph(assets)
+    partitions_def = asset_graph.get_partitions_def(asset_key)
 
-    assets_by_repo_name = {
-        "repo": [
-            unpartitioned_upstream_of_partitioned,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
-
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
+    backfill_data = AssetBackfillData.from_all_partitions(
         asset_graph=asset_graph,
-        asset_selection=[
-            unpartitioned_upstream_of_partitioned.key,
-        ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=pendulum.now("UTC"),
+        asset_selection=[asset_key],
+        dynamic_partitions_store=NOOP_DYNAMIC_PARTITIONS_STORE,
+        backfill_start_time=TIME_NOW,
     )
+
     backfill_id = "test_backfill_id"
     result = execute_asset_backfill_iteration_consume_generator(
         backfill_id=backfill_id,
         asset_backfill_data=backfill_data,
         asset_graph=asset_graph,
-        instance=DagsterInstance.ephemeral(),
-    )
-    assert result.backfill_data != backfill_data
-    assert len(result.run_requests) == 1
-    assert result.run_requests[0].partition_key is None
-    assert result.run_requests[0].tags == {"dagster/backfill": backfill_id}
-
-
-def test_asset_backfill_return_single_run_request_for_partitioned():
-    time_now = pendulum.now("UTC")
-    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
-
-    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.single_run())
-    def upstream_daily_partitioned_asset():
-        return 1
-
-    assets_by_repo_name = {
-        "repo": [
-            upstream_daily_partitioned_asset,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
-
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
-        asset_graph=asset_graph,
-        asset_selection=[
-            upstream_daily_partitioned_asset.key,
-        ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=time_now,
-    )
-
-    result = execute_asset_backfill_iteration_consume_generator(
-        backfill_id="test_backfill_id",
-        asset_backfill_data=backfill_data,
-        asset_graph=asset_graph,
-        instance=DagsterInstance.ephemeral(),
+        instance=instance,
     )
-    assert result.backfill_data != backfill_data
-    assert len(result.run_requests) == 1
-    assert result.run_requests[0].partition_key is None
-    assert result.run_requests[0].tags.get(ASSET_PARTITION_RANGE_START_TAG) == "2023-01-01"
     assert (
-        result.run_requests[0].tags.get(ASSET_PARTITION_RANGE_END_TAG)
-        == daily_partitions_def.get_partition_keys(time_now)[-1]
+        result.backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
+        > backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
     )
-
-
-def test_asset_backfill_return_multiple_run_request_for_partitioned():
-    time_now = pendulum.now("UTC")
-    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition(
-        "2023-01-01", end_date="2023-08-11"
-    )
-    num_of_daily_partitions = daily_partitions_def.get_num_partitions(time_now)
-
-    @asset(partitions_def=daily_partitions_def, backfill_policy=BackfillPolicy.multi_run(7))
-    def upstream_daily_partitioned_asset():
-        return 1
-
-    assets_by_repo_name = {
-        "repo": [
-            upstream_daily_partitioned_asset,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
-
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
-        asset_graph=asset_graph,
-        asset_selection=[
-            upstream_daily_partitioned_asset.key,
-        ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=time_now,
-    )
-
-    result = execute_asset_backfill_iteration_consume_generator(
-        backfill_id="test_backfill_id",
-        asset_backfill_data=backfill_data,
-        asset_graph=asset_graph,
-        instance=DagsterInstance.ephemeral(),
-    )
-    assert result.backfill_data != backfill_data
-    assert len(result.run_requests) == math.ceil(num_of_daily_partitions / 7)
+    assert len(result.run_requests) == expected_num_run_requests
     assert result.run_requests[0].partition_key is None
-    assert result.run_requests[0].tags.get(ASSET_PARTITION_RANGE_START_TAG) == "2023-01-01"
-    assert (
-        result.run_requests[-1].tags.get(ASSET_PARTITION_RANGE_END_TAG)
-        == daily_partitions_def.get_partition_keys(time_now)[-1]
-    )
-
+    if partitions_def is None:
+        assert result.run_requests[0].tags == {"dagster/backfill": backfill_id}
+    else:
+        last_partition_key = partitions_def.get_last_partition_key(TIME_NOW)
+        assert result.run_requests[0].tags.get(ASSET_PARTITION_RANGE_START_TAG) == "2023-01-01"
+        assert result.run_requests[-1].tags.get(ASSET_PARTITION_RANGE_END_TAG) == last_partition_key
 
-def test_asset_backfill_status_count_with_backfill_policies():
-    daily_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
-    weekly_partitions_def = WeeklyPartitionsDefinition("2023-01-01")
 
-    time_now = pendulum.now("UTC")
-    num_of_daily_partitions = daily_partitions_def.get_num_partitions(time_now)
-    num_of_weekly_partitions = weekly_partitions_def.get_num_partitions(time_now)
+@pytest.mark.parametrize(
+    "asset_name", ["upstream_non_partitioned_asset", "upstream_daily_partitioned_asset"]
+)
+def test_asset_backfill_return_single_run_request_for_backfill_policy(
+    single_run_assets: Tuple[AssetsDefinition, ...],
+    asset_name: str,
+    instance: DagsterInstance,
+):
+    assert_run_requests_for_backfill_policy(
+        assets=single_run_assets,
+        asset_key=AssetKey(asset_name),
+        expected_num_run_requests=1,
+        instance=instance,
+    )
 
-    @asset(backfill_policy=BackfillPolicy.single_run())
-    def unpartitioned_upstream_of_partitioned():
-        return 1
 
-    @asset(
-        partitions_def=daily_partitions_def,
-        backfill_policy=BackfillPolicy.single_run(),
-        deps={unpartitioned_upstream_of_partitioned},
+def test_asset_backfill_return_multiple_run_request_for_backfill_policy(
+    multi_run_assets: Tuple[AssetsDefinition, ...],
+    instance: DagsterInstance,
+):
+    assert_run_requests_for_backfill_policy(
+        assets=multi_run_assets,
+        asset_key=AssetKey("upstream_daily_partitioned_asset"),
+        # 222 daily partitions from 2023-01-01 to 2023-08-10, in runs of at most 7 partitions
+        expected_num_run_requests=(222 + 6) // 7,
+        instance=instance,
     )
-    def upstream_daily_partitioned_asset():
-        return 2
 
-    @asset(
-        partitions_def=weekly_partitions_def,
-        backfill_policy=BackfillPolicy.single_run(),
-        deps={upstream_daily_partitioned_asset},
-    )
-    def downstream_weekly_partitioned_asset():
-        return 3
 
-    assets_by_repo_name = {
-        "repo": [
-            unpartitioned_upstream_of_partitioned,
-            upstream_daily_partitioned_asset,
-            downstream_weekly_partitioned_asset,
-        ]
-    }
-    asset_graph = get_asset_graph(assets_by_repo_name)
+def test_asset_backfill_status_count_with_backfill_policies(
+    daily_to_weekly_assets: Tuple[AssetsDefinition, ...],
+):
+    (
+        unpartitioned_upstream_of_partitioned,
+        upstream_daily_partitioned_asset,
+        downstream_weekly_partitioned_asset,
+    ) = daily_to_weekly_assets
+    # 2023-01-01 through 2023-02-28
+    num_of_daily_partitions = 59
+    # weeks starting 2023-01-01 through 2023-02-19
+    num_of_weekly_partitions = 8
+
+    assets_by_repo_name = {"repo": list(daily_to_weekly_assets)}
+    asset_graph = get_cached_asset_graph(daily_to_weekly_assets)
     instance = DagsterInstance.ephemeral()
 
-    # Construct a backfill data with all_partitions=True on assets with single run backfill policies.
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
+    # Construct a backfill data targeting all partitions of assets with single run backfill policies.
+    backfill_data = AssetBackfillData.from_all_partitions(
         asset_graph=asset_graph,
         asset_selection=[
             unpartitioned_upstream_of_partitioned.key,
             upstream_daily_partitioned_asset.key,
             downstream_weekly_partitioned_asset.key,
         ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=time_now,
+        dynamic_partitions_store=NOOP_DYNAMIC_PARTITIONS_STORE,
+        backfill_start_time=TIME_NOW,
     )
 
     (
@@ -370,64 +444,45 @@ def downstream_weekly_partitioned_asset():
         fail_asset_partitions=set(),
     )
 
-    counts = completed_backfill_data.get_backfill_status_per_asset_key(asset_graph)
+    counts = completed_backfill_data.get_backfill_status_by_asset_key(asset_graph)
 
-    assert counts[0].asset_key == unpartitioned_upstream_of_partitioned.key
-    assert counts[0].backfill_status == AssetBackfillStatus.MATERIALIZED
+    unpartitioned_status = counts[unpartitioned_upstream_of_partitioned.key]
+    assert isinstance(unpartitioned_status, UnpartitionedAssetBackfillStatus)
+    assert unpartitioned_status.backfill_status == AssetBackfillStatus.MATERIALIZED
 
-    assert counts[1].asset_key == upstream_daily_partitioned_asset.key
+    daily_status = counts[upstream_daily_partitioned_asset.key]
+    assert isinstance(daily_status, PartitionedAssetBackfillStatus)
     assert (
-        counts[1].partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
+        daily_status.partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
         == num_of_daily_partitions
     )
-    assert counts[1].num_targeted_partitions == num_of_daily_partitions
+    assert daily_status.num_targeted_partitions == num_of_daily_partitions
 
-    assert counts[2].asset_key == downstream_weekly_partitioned_asset.key
+    weekly_status = counts[downstream_weekly_partitioned_asset.key]
+    assert isinstance(weekly_status, PartitionedAssetBackfillStatus)
     assert (
-        counts[2].partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
+        weekly_status.partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
         == num_of_weekly_partitions
     )
-    assert counts[2].num_targeted_partitions == num_of_weekly_partitions
+    assert weekly_status.num_targeted_partitions == num_of_weekly_partitions
 
 
-def test_backfill_run_contains_more_than_one_asset():
-    upstream_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-01")
-    downstream_partitions_def: DailyPartitionsDefinition = DailyPartitionsDefinition("2023-01-02")
-
-    time_now = pendulum.now("UTC")
-    upstream_num_of_partitions = upstream_partitions_def.get_num_partitions(time_now)
-    downstream_num_of_partitions = downstream_partitions_def.get_num_partitions(time_now)
-
-    @asset(partitions_def=upstream_partitions_def, backfill_policy=BackfillPolicy.single_run())
-    def upstream_a():
-        return 1
-
-    @asset(partitions_def=upstream_partitions_def, backfill_policy=BackfillPolicy.single_run())
-    def upstream_b():
-        return 2
-
-    @asset(
-        partitions_def=downstream_partitions_def,
-        backfill_policy=BackfillPolicy.single_run(),
-        deps={"upstream_a"},
-    )
-    def downstream_a():
-        return 1
-
-    @asset(
-        partitions_def=downstream_partitions_def,
-        backfill_policy=BackfillPolicy.single_run(),
-        deps={"upstream_b"},
-    )
-    def downstream_b():
-        return 2
+def test_backfill_run_contains_more_than_one_asset(
+    multi_asset_run_assets: Tuple[AssetsDefinition, ...],
+):
+    upstream_a, upstream_b, downstream_a, downstream_b = multi_asset_run_assets
+    assets_by_repo_name = {"repo": list(multi_asset_run_assets)}
+    asset_graph = get_cached_asset_graph(multi_asset_run_assets)
 
-    assets_by_repo_name = {"repo": [upstream_a, upstream_b, downstream_a, downstream_b]}
-    asset_graph = get_asset_graph(assets_by_repo_name)
+    upstream_num_of_partitions = check.not_none(
+        asset_graph.get_partitions_def(upstream_a.key)
+    ).get_num_partitions(TIME_NOW)
+    downstream_num_of_partitions = check.not_none(
+        asset_graph.get_partitions_def(downstream_a.key)
+    ).get_num_partitions(TIME_NOW)
     instance = DagsterInstance.ephemeral()
 
-    backfill_data = AssetBackfillData.from_asset_partitions(
-        partition_names=None,
+    backfill_data = AssetBackfillData.from_all_partitions(
         asset_graph=asset_graph,
         asset_selection=[
             upstream_a.key,
@@ -435,9 +490,8 @@ def downstream_b():
             downstream_a.key,
             downstream_b.key,
         ],
-        dynamic_partitions_store=MagicMock(),
-        all_partitions=True,
-        backfill_start_time=time_now,
+        dynamic_partitions_store=NOOP_DYNAMIC_PARTITIONS_STORE,
+        backfill_start_time=TIME_NOW,
     )
 
     (
@@ -452,55 +506,28 @@ def downstream_b():
         fail_asset_partitions=set(),
     )
 
-    counts = completed_backfill_data.get_backfill_status_per_asset_key(asset_graph)
+    counts = completed_backfill_data.get_backfill_status_by_asset_key(asset_graph)
 
-    assert counts[0].asset_key == upstream_a.key
-    assert (
-        counts[0].partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
-        == upstream_num_of_partitions
-    )
-    assert counts[0].partitions_counts_by_status[AssetBackfillStatus.FAILED] == 0
-    assert counts[0].partitions_counts_by_status[AssetBackfillStatus.IN_PROGRESS] == 0
-    assert counts[0].num_targeted_partitions == upstream_num_of_partitions
-
-    assert counts[1].asset_key == upstream_b.key
-    assert (
-        counts[1].partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
-        == upstream_num_of_partitions
-    )
-    assert counts[1].partitions_counts_by_status[AssetBackfillStatus.FAILED] == 0
-    assert counts[1].partitions_counts_by_status[AssetBackfillStatus.IN_PROGRESS] == 0
-    assert counts[1].num_targeted_partitions == upstream_num_of_partitions
+    for asset_key, expected_num_partitions in [
+        (upstream_a.key, upstream_num_of_partitions),
+        (upstream_b.key, upstream_num_of_partitions),
+        (downstream_a.key, downstream_num_of_partitions),
+        (downstream_b.key, downstream_num_of_partitions),
+    ]:
+        status = counts[asset_key]
+        assert isinstance(status, PartitionedAssetBackfillStatus)
+        assert (
+            status.partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
+            == expected_num_partitions
+        )
+        assert status.partitions_counts_by_status[AssetBackfillStatus.FAILED] == 0
+        assert status.partitions_counts_by_status[AssetBackfillStatus.IN_PROGRESS] == 0
+        assert status.num_targeted_partitions == expected_num_partitions
 
-    assert counts[2].asset_key == downstream_a.key
-    assert (
-        counts[2].partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
-        == downstream_num_of_partitions
-    )
-    assert counts[2].partitions_counts_by_status[AssetBackfillStatus.FAILED] == 0
-    assert counts[2].partitions_counts_by_status[AssetBackfillStatus.IN_PROGRESS] == 0
-    assert counts[2].num_targeted_partitions == downstream_num_of_partitions
-
-    assert counts[3].asset_key == downstream_b.key
-    assert (
-        counts[3].partitions_counts_by_status[AssetBackfillStatus.MATERIALIZED]
-        == downstream_num_of_partitions
-    )
-    assert counts[3].partitions_counts_by_status[AssetBackfillStatus.FAILED] == 0
-    assert counts[3].partitions_counts_by_status[AssetBackfillStatus.IN_PROGRESS] == 0
-    assert counts[3].num_targeted_partitions == downstream_num_of_partitions
 
-
-def test_dynamic_partitions():
-    @asset(
-        backfill_policy=BackfillPolicy.single_run(),
-        partitions_def=DynamicPartitionsDefinition(name="apple"),
-    )
-    def asset1() -> None:
-        ...
-
-    assets_by_repo_name = {"repo": [asset1]}
-    asset_graph = get_asset_graph(assets_by_repo_name)
+def test_dynamic_partitions(dynamic_partitions_assets: Tuple[AssetsDefinition, ...]):
+    (asset1,) = dynamic_partitions_assets
+    asset_graph = get_cached_asset_graph(dynamic_partitions_assets)
 
     instance = DagsterInstance.ephemeral()
     instance.add_dynamic_partitions("apple", ["foo", "bar"])
@@ -510,7 +537,7 @@ def asset1() -> None:
         asset_selection=[asset1.key],
         dynamic_partitions_store=instance,
         partition_names=["foo", "bar"],
-        backfill_start_time=pendulum.now("UTC"),
+        backfill_start_time=TIME_NOW,
         all_partitions=False,
     )
 
@@ -520,7 +547,10 @@ def asset1() -> None:
         asset_graph=asset_graph,
         instance=instance,
     )
-    assert result.backfill_data != backfill_data
+    assert (
+        result.backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
+        > backfill_data.requested_subset.num_partitions_and_non_partitioned_assets
+    )
     assert len(result.run_requests) == 1
     assert result.run_requests[0].tags.get(ASSET_PARTITION_RANGE_START_TAG) == "foo"
     assert result.run_requests[0].tags.get(ASSET_PARTITION_RANGE_END_TAG) == "bar"
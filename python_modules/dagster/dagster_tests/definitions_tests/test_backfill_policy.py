@@ -8,3 +8,11 @@ def test_type():
     assert BackfillPolicy.multi_run().policy_type == BackfillPolicyType.MULTI_RUN
     with pytest.raises(ParameterCheckError):
         BackfillPolicy.multi_run(max_partitions_per_run=None)
+
+
+def test_multi_run_validates_every_call():
+    assert BackfillPolicy.multi_run(max_partitions_per_run=7) == BackfillPolicy(
+        max_partitions_per_run=7
+    )
+    with pytest.raises(ParameterCheckError):
+        BackfillPolicy.multi_run(max_partitions_per_run=7.0)  # type: ignore
@@ -1,7 +1,20 @@
-from dagster import AssetMaterialization
+import pickle
+
+from dagster import AssetKey, AssetMaterialization
 
 
 def test_asset_materialization_metadata():
     materialization = AssetMaterialization(asset_key="abc", metadata={"a": "b", "c": 1})
     assert materialization.metadata["a"].value == "b"
     assert materialization.metadata["c"].value == 1
+
+
+def test_asset_key_hash():
+    asset_key = AssetKey(["a", "b"])
+    assert hash(asset_key) == hash(("a", "b"))
+    assert hash(asset_key) == hash(AssetKey(["a", "b"]))
+
+    unpickled = pickle.loads(pickle.dumps(asset_key))
+    assert "_hash" not in unpickled.__dict__
+    assert unpickled == asset_key
+    assert hash(unpickled) == hash(asset_key)